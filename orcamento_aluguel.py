@@ -1,10 +1,15 @@
 # orcamento_aluguel.py
 from __future__ import annotations
 
-import csv
-from dataclasses import dataclass
+import asyncio
+import functools
+import operator
+import os
+import sys
+from array import array
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Optional
+from typing import Iterable, Optional
 
 
 def brl(valor: float) -> str:
@@ -15,7 +20,23 @@ def brl(valor: float) -> str:
     return f"R$ {s}"
 
 
-@dataclass(frozen=True)
+# Tipos canônicos internados: quem já recebeu um deles pode ser reconhecido por identidade
+_APARTAMENTO = sys.intern("Apartamento")
+_CASA = sys.intern("Casa")
+_ESTUDIO = sys.intern("Estudio")
+
+# Aceita variações digitadas pelo usuário -> tipo canônico
+_TIPO_MAP = {
+    "apartamento": _APARTAMENTO,
+    "apto": _APARTAMENTO,
+    "casa": _CASA,
+    "estudio": _ESTUDIO,
+    "estúdio": _ESTUDIO,
+    "studio": _ESTUDIO,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Orcamento:
     tipo_imovel: str
     quartos: int
@@ -25,34 +46,86 @@ class Orcamento:
     aluguel_mensal: float
     contrato_total: float
     contrato_parcelas: int
+    # derivado de contrato_total / contrato_parcelas; calculado uma vez na criação
+    valor_contrato_parcela: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def valor_contrato_parcela(self) -> float:
-        return self.contrato_total / self.contrato_parcelas
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "valor_contrato_parcela", self.contrato_total / self.contrato_parcelas)
 
     def resumo(self) -> str:
-        linhas = [
-            "==== RESUMO DO ORÇAMENTO ====",
-            f"Tipo do imóvel: {self.tipo_imovel}",
-            f"Quartos: {self.quartos}" if self.tipo_imovel != "Estudio" else "Quartos: (não aplicável)",
-        ]
+        tipo = self.tipo_imovel
+        quartos_linha = f"Quartos: {self.quartos}" if tipo != "Estudio" else "Quartos: (não aplicável)"
+        garagem_linha = (f"Garagem: {'Sim' if self.tem_garagem else 'Não'}\n"
+                         if tipo in ("Apartamento", "Casa") else "")
+        criancas_linha = (f"Possui crianças: {'Sim' if self.criancas else 'Não'}\n"
+                          if tipo == "Apartamento" and self.criancas is not None else "")
+        vagas_linha = f"Vagas (estacionamento): {self.vagas_estudio}\n" if tipo == "Estudio" else ""
+
+        return (
+            "==== RESUMO DO ORÇAMENTO ====\n"
+            f"Tipo do imóvel: {tipo}\n"
+            f"{quartos_linha}\n"
+            f"{garagem_linha}{criancas_linha}{vagas_linha}"
+            f"Aluguel mensal orçado: {brl(self.aluguel_mensal)}\n"
+            f"Contrato imobiliário: {brl(self.contrato_total)}\n"
+            f"Parcelamento do contrato: {self.contrato_parcelas}x de {brl(self.valor_contrato_parcela)}\n"
+            "============================="
+        )
 
-        if self.tipo_imovel in ("Apartamento", "Casa"):
-            linhas.append(f"Garagem: {'Sim' if self.tem_garagem else 'Não'}")
 
-        if self.tipo_imovel == "Apartamento" and self.criancas is not None:
-            linhas.append(f"Possui crianças: {'Sim' if self.criancas else 'Não'}")
+# Códigos de tipo usados nas colunas de OrcamentoLote
+_TIPOS = (_APARTAMENTO, _CASA, _ESTUDIO)
+_TIPO_CODIGO = {tipo: codigo for codigo, tipo in enumerate(_TIPOS)}
 
-        if self.tipo_imovel == "Estudio":
-            linhas.append(f"Vagas (estacionamento): {self.vagas_estudio}")
 
-        linhas += [
-            f"Aluguel mensal orçado: {brl(self.aluguel_mensal)}",
-            f"Contrato imobiliário: {brl(self.contrato_total)}",
-            f"Parcelamento do contrato: {self.contrato_parcelas}x de {brl(self.valor_contrato_parcela)}",
-            "=============================",
-        ]
-        return "\n".join(linhas)
+@dataclass(slots=True)
+class OrcamentoLote:
+    """Vários orçamentos guardados em colunas (array), sem um objeto por orçamento."""
+    contrato_total: float
+    tipos: array = field(default_factory=lambda: array("b"))       # código em _TIPOS
+    quartos: array = field(default_factory=lambda: array("b"))
+    garagens: array = field(default_factory=lambda: array("b"))    # 0/1
+    criancas: array = field(default_factory=lambda: array("b"))    # -1 = não informado
+    vagas_estudio: array = field(default_factory=lambda: array("q"))
+    alugueis: array = field(default_factory=lambda: array("d"))
+    parcelas: array = field(default_factory=lambda: array("b"))
+
+    def __len__(self) -> int:
+        return len(self.alugueis)
+
+    def adicionar(self, tipo_imovel: str, quartos: int, tem_garagem: bool, criancas: Optional[bool],
+                  vagas_estudio: int, aluguel_mensal: float, contrato_parcelas: int) -> None:
+        codigo = _TIPO_CODIGO.get(tipo_imovel)
+        if codigo is None:
+            raise ValueError("Tipo inválido. Use: Apartamento, Casa ou Estudio.")
+        if criancas is not None and not isinstance(criancas, bool):
+            raise ValueError("Possui crianças deve ser True, False ou None.")
+
+        colunas = (self.tipos, self.quartos, self.garagens, self.criancas,
+                   self.vagas_estudio, self.alugueis, self.parcelas)
+        valores = (codigo, quartos, bool(tem_garagem), -1 if criancas is None else criancas,
+                   vagas_estudio, aluguel_mensal, contrato_parcelas)
+        # converte tudo antes de gravar: um valor inválido não deixa as colunas com tamanhos diferentes
+        try:
+            novos = [array(coluna.typecode, (valor,)) for coluna, valor in zip(colunas, valores)]
+        except (TypeError, OverflowError) as e:
+            raise ValueError(f"Valor inválido para o lote: {e}") from e
+        for coluna, novo in zip(colunas, novos):
+            coluna.extend(novo)
+
+    def orcamento(self, i: int) -> Orcamento:
+        """Monta o Orcamento da posição i (para resumo() ou exportação)."""
+        criancas = self.criancas[i]
+        return Orcamento(
+            tipo_imovel=_TIPOS[self.tipos[i]],
+            quartos=self.quartos[i],
+            tem_garagem=bool(self.garagens[i]),
+            criancas=None if criancas < 0 else bool(criancas),
+            vagas_estudio=self.vagas_estudio[i],
+            aluguel_mensal=self.alugueis[i],
+            contrato_total=self.contrato_total,
+            contrato_parcelas=self.parcelas[i]
+        )
 
 
 class CalculadoraAluguel:
@@ -85,40 +158,124 @@ class CalculadoraAluguel:
                  possui_criancas: Optional[bool] = None,
                  vagas_estudio: int = 0,
                  parcelas_contrato: int = 1) -> Orcamento:
-
+        # valores sobrescritos na instância: calcula direto, sem cache
+        if vars(self):
+            return self._calcular(tipo_imovel, quartos, tem_garagem,
+                                  possui_criancas, vagas_estudio, parcelas_contrato)
+
+        # cálculo é puro e o Orcamento é imutável: repetições saem do cache.
+        # A chave leva os valores atuais das constantes (atributos públicos em maiúsculas da classe),
+        # então alterá-las na classe não devolve resultado antigo.
+        calc_cls = type(self)
+        constantes = _ler_constantes(calc_cls)(calc_cls)
+        try:
+            return _calcular_cached(calc_cls, constantes, tipo_imovel, quartos, tem_garagem,
+                                    possui_criancas, vagas_estudio, parcelas_contrato)
+        except TypeError as e:  # ex.: argumento não hasheável (lista)
+            raise ValueError(f"Parâmetros inválidos para o orçamento: {e}") from e
+
+    def calcular_lote(self,
+                      tipos: Iterable[str],
+                      quartos: Iterable[int],
+                      garagens: Iterable[bool],
+                      criancas: Iterable[Optional[bool]],
+                      vagas: Iterable[int],
+                      parcelas: Iterable[int]) -> OrcamentoLote:
+        """Calcula vários orçamentos (colunas paralelas) e devolve um OrcamentoLote."""
+        tipos = [self._normalizar_tipo(t) for t in tipos]
+        quartos, garagens, criancas, vagas = list(quartos), list(garagens), list(criancas), list(vagas)
+        # a coluna guarda sim/não/não informado; outro valor deixaria o desconto em desacordo com a coluna
+        # (só o apartamento usa o campo)
+        if any(t is _APARTAMENTO and k is not None and not isinstance(k, bool) for t, k in zip(tipos, criancas)):
+            raise ValueError("Possui crianças deve ser True, False ou None.")
+        alugueis = self.calcular_alugueis_lote(tipos, quartos, garagens, criancas, vagas)
+
+        lote = OrcamentoLote(self.CONTRATO_TOTAL)
+        for tipo, q, g, k, v, p, aluguel in zip(tipos, quartos, garagens, criancas, vagas, parcelas, alugueis,
+                                                 strict=True):
+            # mesmos campos que os _orcamento_* preenchem para cada tipo
+            if tipo is _ESTUDIO:
+                q, g, k = 0, False, None
+            else:
+                # quartos já validado em 1 ou 2 pelo cálculo do aluguel (aceita 2.0, como calcular)
+                q, v = int(q), 0
+                if tipo is _CASA:
+                    k = None
+            lote.adicionar(tipo, q, g, k, v, aluguel, self._validar_parcelas(p))
+        return lote
+
+    def calcular_alugueis_lote(self,
+                               tipos: Iterable[str],
+                               quartos: Iterable[int],
+                               garagens: Iterable[bool],
+                               criancas: Iterable[Optional[bool]],
+                               vagas: Iterable[int]) -> list[float]:
+        """Calcula só o aluguel mensal de vários pedidos (colunas paralelas, mesmo tamanho)."""
+        # o domínio de combinações é pequeno: cada uma é calculada uma vez e reaproveitada
+        memo: dict[tuple, float] = {}
+        alugueis = []
+        for pedido in zip(tipos, quartos, garagens, criancas, vagas, strict=True):
+            # chave inclui os tipos (como typed=True no lru_cache): False e 0 dão aluguéis diferentes
+            chave = (*pedido, *map(type, pedido))
+            aluguel = memo.get(chave)
+            if aluguel is None:
+                aluguel = memo[chave] = self._calc_aluguel(*pedido)
+            alugueis.append(aluguel)
+        return alugueis
+
+    def _calc_aluguel(self, tipo_imovel: str, quartos: int, tem_garagem: bool,
+                      possui_criancas: Optional[bool], vagas: int) -> float:
+        tipo = self._normalizar_tipo(tipo_imovel)
+        # reaproveita os construtores por tipo; as parcelas não influenciam o aluguel
+        return self._ORCAMENTO_POR_TIPO[tipo](self, quartos, tem_garagem, possui_criancas,
+                                              vagas, 1).aluguel_mensal
+
+    def _calcular(self,
+                  tipo_imovel: str,
+                  quartos: int,
+                  tem_garagem: bool,
+                  possui_criancas: Optional[bool],
+                  vagas_estudio: int,
+                  parcelas_contrato: int) -> Orcamento:
         tipo = self._normalizar_tipo(tipo_imovel)
         parcelas = self._validar_parcelas(parcelas_contrato)
 
-        if tipo == "Apartamento":
-            aluguel = self._calc_apartamento(quartos, tem_garagem, possui_criancas)
-            return Orcamento(
-                tipo_imovel=tipo,
-                quartos=quartos,
-                tem_garagem=tem_garagem,
-                criancas=possui_criancas,
-                vagas_estudio=0,
-                aluguel_mensal=aluguel,
-                contrato_total=self.CONTRATO_TOTAL,
-                contrato_parcelas=parcelas
-            )
+        return self._ORCAMENTO_POR_TIPO[tipo](self, quartos, tem_garagem, possui_criancas,
+                                              vagas_estudio, parcelas)
 
-        if tipo == "Casa":
-            aluguel = self._calc_casa(quartos, tem_garagem)
-            return Orcamento(
-                tipo_imovel=tipo,
-                quartos=quartos,
-                tem_garagem=tem_garagem,
-                criancas=None,
-                vagas_estudio=0,
-                aluguel_mensal=aluguel,
-                contrato_total=self.CONTRATO_TOTAL,
-                contrato_parcelas=parcelas
-            )
+    def _orcamento_apartamento(self, quartos: int, tem_garagem: bool, possui_criancas: Optional[bool],
+                               vagas_estudio: int, parcelas: int) -> Orcamento:
+        aluguel = self._calc_apartamento(quartos, tem_garagem, possui_criancas)
+        return Orcamento(
+            tipo_imovel="Apartamento",
+            quartos=quartos,
+            tem_garagem=tem_garagem,
+            criancas=possui_criancas,
+            vagas_estudio=0,
+            aluguel_mensal=aluguel,
+            contrato_total=self.CONTRATO_TOTAL,
+            contrato_parcelas=parcelas
+        )
+
+    def _orcamento_casa(self, quartos: int, tem_garagem: bool, possui_criancas: Optional[bool],
+                        vagas_estudio: int, parcelas: int) -> Orcamento:
+        aluguel = self._calc_casa(quartos, tem_garagem)
+        return Orcamento(
+            tipo_imovel="Casa",
+            quartos=quartos,
+            tem_garagem=tem_garagem,
+            criancas=None,
+            vagas_estudio=0,
+            aluguel_mensal=aluguel,
+            contrato_total=self.CONTRATO_TOTAL,
+            contrato_parcelas=parcelas
+        )
 
-        # Estudio
+    def _orcamento_estudio(self, quartos: int, tem_garagem: bool, possui_criancas: Optional[bool],
+                           vagas_estudio: int, parcelas: int) -> Orcamento:
         aluguel = self._calc_estudio(vagas_estudio)
         return Orcamento(
-            tipo_imovel=tipo,
+            tipo_imovel="Estudio",
             quartos=0,
             tem_garagem=False,
             criancas=None,
@@ -128,15 +285,21 @@ class CalculadoraAluguel:
             contrato_parcelas=parcelas
         )
 
+    # Tipo canônico -> construtor do orçamento
+    _ORCAMENTO_POR_TIPO = {
+        "Apartamento": _orcamento_apartamento,
+        "Casa": _orcamento_casa,
+        "Estudio": _orcamento_estudio,
+    }
+
     def _normalizar_tipo(self, tipo: str) -> str:
-        t = (tipo or "").strip().lower()
-        if t in ("apartamento", "apto"):
-            return "Apartamento"
-        if t in ("casa",):
-            return "Casa"
-        if t in ("estudio", "estúdio", "studio"):
-            return "Estudio"
-        raise ValueError("Tipo inválido. Use: Apartamento, Casa ou Estudio.")
+        # já canônico (ex.: main() repassando o tipo normalizado): nada a fazer
+        if tipo is _APARTAMENTO or tipo is _CASA or tipo is _ESTUDIO:
+            return tipo
+        res = _TIPO_MAP.get((tipo or "").strip().lower())
+        if res is None:
+            raise ValueError("Tipo inválido. Use: Apartamento, Casa ou Estudio.")
+        return res
 
     def _validar_parcelas(self, parcelas: int) -> int:
         if not isinstance(parcelas, int):
@@ -191,43 +354,89 @@ class CalculadoraAluguel:
         return aluguel
 
 
+@functools.cache
+def _ler_constantes(calc_cls: type[CalculadoraAluguel]) -> operator.attrgetter:
+    """Leitor das constantes de preço (atributos públicos em maiúsculas) de uma classe de calculadora."""
+    return operator.attrgetter(*sorted(nome for nome in dir(calc_cls)
+                                       if nome.isupper() and not nome.startswith("_")))
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _calcular_cached(calc_cls: type[CalculadoraAluguel],
+                     constantes: tuple,
+                     tipo_imovel: str,
+                     quartos: int,
+                     tem_garagem: bool,
+                     possui_criancas: Optional[bool],
+                     vagas_estudio: int,
+                     parcelas_contrato: int) -> Orcamento:
+    # a chave inclui a classe e as constantes para que outras tabelas de preço não compartilhem resultados
+    return calc_cls()._calcular(tipo_imovel, quartos, tem_garagem,
+                                possui_criancas, vagas_estudio, parcelas_contrato)
+
+
 class ExportadorCSV:
     """Gera o arquivo CSV com 12 parcelas do orçamento (mensalidade + parcela do contrato)."""
 
+    # Cabeçalho fixo (mesmo terminador de linha "\r\n" que o módulo csv usava)
+    CABECALHO = b"parcela;aluguel_mensal;contrato_parcela;total_mes;data_referencia\r\n"
+
     @staticmethod
     def exportar_12_parcelas(orc: Orcamento, caminho_arquivo: str) -> None:
         hoje = date.today()
+        data_referencia = f"{hoje.year}-{hoje.month:02d}"
+        aluguel = orc.aluguel_mensal
+        aluguel_s = f"{aluguel:.2f}"
         valor_contrato_parcela = orc.valor_contrato_parcela
 
         # Para as 12 parcelas do orçamento:
         # - Aluguel sempre entra
         # - Contrato entra somente nas primeiras N parcelas (até 5), depois 0
-        linhas = []
+        # Esquema fixo e só numérico: monta as linhas direto, sem o módulo csv
+        linhas = [ExportadorCSV.CABECALHO]
         for i in range(1, 13):
-            contrato_esta_parcela = valor_contrato_parcela if i <= orc.contrato_parcelas else 0.0
-            total_mes = orc.aluguel_mensal + contrato_esta_parcela
-            linhas.append({
-                "parcela": i,
-                "aluguel_mensal": f"{orc.aluguel_mensal:.2f}",
-                "contrato_parcela": f"{contrato_esta_parcela:.2f}",
-                "total_mes": f"{total_mes:.2f}",
-                "data_referencia": f"{hoje.year}-{hoje.month:02d}"
-            })
-
-        with open(caminho_arquivo, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["parcela", "aluguel_mensal", "contrato_parcela", "total_mes", "data_referencia"],
-                delimiter=";"
+            contrato = valor_contrato_parcela if i <= orc.contrato_parcelas else 0.0
+            linhas.append(
+                f"{i};{aluguel_s};{contrato:.2f};{aluguel + contrato:.2f};{data_referencia}\r\n".encode()
             )
-            writer.writeheader()
-            writer.writerows(linhas)
+
+        if not hasattr(os, "writev"):  # ex.: Windows
+            with open(caminho_arquivo, "wb") as f:
+                f.write(b"".join(linhas))
+            return
+
+        # Uma única chamada writev entrega todas as linhas, sem copiar para um buffer intermediário
+        fd = os.open(caminho_arquivo, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            escrito = os.writev(fd, linhas)
+            total = sum(map(len, linhas))
+            if escrito < total:  # escrita parcial: completa com o restante
+                restante = memoryview(b"".join(linhas))[escrito:]
+                while restante:
+                    restante = restante[os.write(fd, restante):]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    async def exportar_12_parcelas_async(orc: Orcamento, caminho_arquivo: str) -> None:
+        """Versão assíncrona: a escrita roda numa thread, sem bloquear o event loop."""
+        await asyncio.to_thread(ExportadorCSV.exportar_12_parcelas, orc, caminho_arquivo)
+
+
+def _ler_linha(msg: str) -> str:
+    """Como input(), mas lendo direto de sys.stdin (mais barato com entrada redirecionada)."""
+    sys.stdout.write(msg)
+    sys.stdout.flush()
+    linha = sys.stdin.readline()
+    if not linha:
+        raise EOFError
+    return linha.strip()
 
 
 def _ler_int(msg: str, validos: Optional[set[int]] = None, minimo: Optional[int] = None) -> int:
     while True:
         try:
-            v = int(input(msg).strip())
+            v = int(_ler_linha(msg))
             if validos is not None and v not in validos:
                 print(f"Valor inválido. Opções: {sorted(validos)}")
                 continue
@@ -241,7 +450,7 @@ def _ler_int(msg: str, validos: Optional[set[int]] = None, minimo: Optional[int]
 
 def _ler_bool(msg: str) -> bool:
     while True:
-        v = input(msg + " (s/n): ").strip().lower()
+        v = _ler_linha(msg + " (s/n): ").lower()
         if v in ("s", "sim"):
             return True
         if v in ("n", "nao", "não"):
@@ -253,7 +462,7 @@ def main() -> None:
     print("=== Sistema de Orçamento de Aluguel (R.M) ===")
     print("Tipos disponíveis: Apartamento, Casa, Estudio")
 
-    tipo = input("Informe o tipo do imóvel: ").strip()
+    tipo = _ler_linha("Informe o tipo do imóvel: ")
     calc = CalculadoraAluguel()
 
     tipo_norm = None
@@ -297,8 +506,8 @@ def main() -> None:
 
     print()
     if _ler_bool("Deseja gerar o arquivo CSV com as 12 parcelas do orçamento?"):
-        nome = input("Nome do arquivo (ex: parcelas.csv): ").strip()
-        if not nome.lower().endswith(".csv"):
+        nome = _ler_linha("Nome do arquivo (ex: parcelas.csv): ")
+        if nome[-4:].lower() != ".csv":
             nome += ".csv"
         try:
             ExportadorCSV.exportar_12_parcelas(orc, nome)
@@ -0,0 +1,100 @@
+# test_orcamento_aluguel.py
+import itertools
+import unittest
+
+from orcamento_aluguel import CalculadoraAluguel, OrcamentoLote
+
+# Todas as combinações de entrada aceitas por calcular()
+GRADE = list(itertools.product(
+    ("apto", "Casa", "estúdio"),  # tipo
+    (1, 2),                       # quartos
+    (False, True, None, 1),       # garagem
+    (None, True, False),          # crianças
+    (0, 1, 2, 5),                 # vagas
+    (1, 3, 5),                    # parcelas
+))
+
+
+class TestCalculoEmLote(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.calc = CalculadoraAluguel()
+
+    def test_alugueis_lote_igual_a_calcular(self) -> None:
+        tipos, quartos, garagens, criancas, vagas, _ = zip(*GRADE)
+        alugueis = self.calc.calcular_alugueis_lote(tipos, quartos, garagens, criancas, vagas)
+        esperado = [self.calc.calcular(*linha).aluguel_mensal for linha in GRADE]
+        self.assertEqual(alugueis, esperado)
+
+    def test_alugueis_lote_nao_depende_da_ordem(self) -> None:
+        # False e 0 têm o mesmo hash, mas só False dá o desconto
+        for criancas in ([False, 0], [0, False]):
+            alugueis = self.calc.calcular_alugueis_lote(["apto"] * 2, [1, 1], [False] * 2, criancas, [0, 0])
+            esperado = [self.calc.calcular("apto", 1, False, k).aluguel_mensal for k in criancas]
+            self.assertEqual(alugueis, esperado)
+
+    def test_lote_igual_a_calcular(self) -> None:
+        lote = self.calc.calcular_lote(*zip(*GRADE))
+        self.assertEqual(len(lote), len(GRADE))
+        for i, linha in enumerate(GRADE):
+            orc, esperado = lote.orcamento(i), self.calc.calcular(*linha)
+            self.assertEqual(orc.aluguel_mensal, esperado.aluguel_mensal, linha)
+            self.assertEqual(orc.resumo(), esperado.resumo(), linha)
+
+    def test_lote_aceita_entradas_de_calcular(self) -> None:
+        linhas = [
+            ("apto", 2.0, True, False, 0, 1),
+            ("casa", 1, None, 0, 0, 2),       # crianças é ignorado fora do apartamento
+            ("studio", 0, 0, 0, 2 ** 40, 3),
+        ]
+        lote = self.calc.calcular_lote(*zip(*linhas))
+        for i, linha in enumerate(linhas):
+            self.assertEqual(lote.orcamento(i).aluguel_mensal, self.calc.calcular(*linha).aluguel_mensal)
+
+    def test_lote_rejeita_com_value_error(self) -> None:
+        invalidas = [
+            ("studio", 0, False, None, 2.5, 1),
+            ("apto", 1, False, 0, 0, 1),
+            ("casa", 3, False, None, 0, 1),
+            ("casa", 1, False, None, 0, 2.5),
+            ("xx", 1, False, None, 0, 1),
+        ]
+        for linha in invalidas:
+            with self.assertRaises(ValueError, msg=linha):
+                self.calc.calcular_lote(*zip(linha))
+
+    def test_adicionar_rejeita_sem_desalinhar_colunas(self) -> None:
+        lote = OrcamentoLote(2000.0)
+        with self.assertRaises(ValueError):
+            lote.adicionar("apto", 1, False, None, 0, 700.0, 1)
+        with self.assertRaises(ValueError):
+            lote.adicionar("Casa", 300, False, None, 0, 900.0, 1)
+        lote.adicionar("Casa", 1, False, None, 0, 900.0, 1)
+        self.assertEqual({len(c) for c in (lote.tipos, lote.quartos, lote.alugueis, lote.parcelas)}, {1})
+
+
+class TestCacheCalcular(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.calc = CalculadoraAluguel()
+
+    def test_sobrescrita_na_instancia(self) -> None:
+        self.calc.VALOR_CASA_1Q = 1000.0
+        self.assertEqual(self.calc.calcular("casa").aluguel_mensal, 1000.0)
+
+    def test_constante_alterada_na_classe(self) -> None:
+        original = CalculadoraAluguel.CONTRATO_TOTAL
+        self.assertEqual(self.calc.calcular("casa").contrato_total, original)
+        CalculadoraAluguel.CONTRATO_TOTAL = 3000.0
+        try:
+            self.assertEqual(self.calc.calcular("casa").contrato_total, 3000.0)
+        finally:
+            CalculadoraAluguel.CONTRATO_TOTAL = original
+
+    def test_argumento_nao_hasheavel(self) -> None:
+        with self.assertRaises(ValueError):
+            self.calc.calcular("Casa", quartos=[1])
+
+
+if __name__ == "__main__":
+    unittest.main()